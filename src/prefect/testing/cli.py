@@ -9,6 +9,10 @@ from typer.testing import CliRunner, Result  # type: ignore
 from prefect.cli import app
 from prefect.utilities.asyncutils import in_async_main_thread
 
+# The runner holds no state between invocations; sharing one avoids rebuilding it for
+# every `invoke_and_assert` call
+_runner = CliRunner()
+
 
 def check_contains(cli_result: Result, content: str, should_contain: bool):
     """
@@ -92,7 +96,7 @@ def invoke_and_assert(
                 """
             )
         )
-    runner = CliRunner()
+    runner = _runner
     if temp_dir:
         ctx = runner.isolated_filesystem(temp_dir=temp_dir)
     else:
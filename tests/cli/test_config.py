@@ -1,27 +1,44 @@
+"""
+Tests for the `prefect config` CLI commands.
+
+PYTEST_DONT_REWRITE: assertion rewriting is disabled for this module. Equality
+checks carry explicit messages with the actual value. Membership checks on the CLI
+output rely on `invoke_and_assert` printing the output, which pytest reports as
+captured stdout, including for output captured while setting up a fixture.
+"""
+
+import re
 import sys
+import textwrap
+from pathlib import Path
+from typing import Any
 
 import pytest
 import toml
+from rich.console import Console
 from typer import Exit
 
 import prefect.context
 import prefect.settings
+import prefect.settings.profiles
+from prefect.cli.config import set_ as config_set
+from prefect.cli.root import app
 from prefect.context import use_profile
 from prefect.settings import (
     PREFECT_API_DATABASE_TIMEOUT,
     PREFECT_API_KEY,
+    PREFECT_CLI_PROMPT,
+    PREFECT_CLI_WRAP_LINES,
     PREFECT_CLIENT_RETRY_EXTRA_CODES,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
     PREFECT_PROFILES_PATH,
-    PREFECT_SERVER_ALLOW_EPHEMERAL_MODE,
     PREFECT_TEST_SETTING,
     Profile,
     ProfilesCollection,
-    load_profiles,
     save_profiles,
     temporary_settings,
 )
-from prefect.settings.legacy import _get_valid_setting_names
+from prefect.settings.legacy import _get_settings_fields, _get_valid_setting_names
 from prefect.testing.cli import invoke_and_assert
 from prefect.utilities.filesystem import tmpchdir
 
@@ -33,6 +50,88 @@ FROM_DOT_ENV = "(from .env file)"
 FROM_PREFECT_TOML = "(from prefect.toml)"
 FROM_PYPROJECT_TOML = "(from pyproject.toml)"
 
+# Names of every setting that `prefect config view` can display
+SETTING_NAMES = frozenset(_get_valid_setting_names(prefect.settings.Settings))
+
+# Setting definitions keyed by name and accessor
+SETTING_FIELDS = _get_settings_fields(prefect.settings.Settings)
+
+# A setting line displayed by `prefect config view`, capturing the setting name and
+# its quoted value without the optional source
+SETTING_LINE_RE = re.compile(
+    r"^(PREFECT_[A-Z0-9_]+)=('.*?')(?: \(from [^)]+\))?$", re.M
+)
+
+# Expected output of `prefect config` commands, normalized once at import
+SET_DEFAULT_PROFILE_OUTPUT = textwrap.dedent(
+    """
+    Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
+    Updated profile 'ephemeral'.
+    """
+).strip()
+SET_FOO_PROFILE_OUTPUT = textwrap.dedent(
+    """
+    Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
+    Updated profile 'foo'.
+    """
+).strip()
+SET_EQUAL_SIGN_IN_VALUE_OUTPUT = textwrap.dedent(
+    """
+    Set 'PREFECT_API_KEY' to 'foo=bar'.
+    Updated profile 'foo'.
+    """
+).strip()
+SET_MULTIPLE_SETTINGS_OUTPUT = textwrap.dedent(
+    """
+    Set 'PREFECT_API_KEY' to 'FOO'.
+    Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
+    Updated profile 'foo'.
+    """
+).strip()
+UNKNOWN_SETTING_OUTPUT = "Unknown setting name 'PREFECT_FOO'."
+DISALLOWED_SETTING_OUTPUT = (
+    "Setting {!r} cannot be changed with this command. Use an environment variable"
+    " instead."
+)
+UNPARSABLE_SETTING_OUTPUT = (
+    "Failed to parse argument 'PREFECT_FOO_BAR'. Use the format 'VAR=VAL'."
+)
+UNSET_SINGLE_SETTING_OUTPUT = textwrap.dedent(
+    """
+    Unset 'PREFECT_API_KEY'.
+    Updated profile 'foo'.
+    """
+).strip()
+UNSET_MULTIPLE_SETTINGS_OUTPUT = textwrap.dedent(
+    """
+    Unset 'PREFECT_API_KEY'.
+    Unset 'PREFECT_TEST_SETTING'.
+    Updated profile 'foo'.
+    """
+).strip()
+UNSET_PRESENT_IN_ENVIRONMENT_OUTPUT = textwrap.dedent(
+    """
+    Unset 'PREFECT_API_KEY'.
+    'PREFECT_API_KEY' is also set by an environment variable. Use `unset PREFECT_API_KEY` to clear it.
+    Updated profile 'foo'.
+    """
+).strip()
+SETTING_NOT_IN_PROFILE_OUTPUT = "'PREFECT_TEST_SETTING' is not set in profile 'foo'."
+
+# `save_profiles` does not mutate the collection, so tests can share a single instance
+EMPTY_FOO_PROFILES = ProfilesCollection(
+    [Profile.model_construct(name="foo", settings={})], active=None
+)
+
+# `use_profile` copies the profile settings, so view tests can share a single instance
+VIEW_PROFILE = Profile.model_construct(
+    name="foo",
+    settings={
+        PREFECT_API_DATABASE_TIMEOUT: 2.0,
+        PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: 1000001,
+    },
+)
+
 
 @pytest.fixture(autouse=True)
 def interactive_console(monkeypatch):
@@ -60,67 +159,148 @@ def temporary_profiles_path(tmp_path):
         yield path
 
 
-def test_set_using_default_profile():
+@pytest.fixture(autouse=True)
+def stored_profiles(temporary_profiles_path, monkeypatch):
+    """
+    Keep the contents of the temporary profiles file in memory instead of writing and
+    parsing TOML on every `save_profiles` / `load_profiles` call.
+
+    The stored data has the same shape as the TOML document so values round-trip
+    exactly as they would through the file.
+    """
+    stored: dict[str, Any] = {"active": None, "profiles": {}}
+    # `load_profiles` only reads the user profiles if the path exists; an empty store
+    # reads back as an empty collection, the same as a missing file
+    temporary_profiles_path.touch(mode=0o600)
+    read_profiles_from = prefect.settings.profiles._read_profiles_from
+    write_profiles_to = prefect.settings.profiles._write_profiles_to
+
+    def _read_profiles_from(path: Path) -> ProfilesCollection:
+        if path != temporary_profiles_path:
+            return read_profiles_from(path)
+        return ProfilesCollection(
+            [
+                Profile(name=name, settings=settings, source=path)
+                for name, settings in stored["profiles"].items()
+            ],
+            active=stored["active"],
+        )
+
+    def _write_profiles_to(path: Path, profiles: ProfilesCollection) -> None:
+        if path != temporary_profiles_path:
+            return write_profiles_to(path, profiles)
+        stored.update(profiles.to_dict())
+
+    monkeypatch.setattr(
+        "prefect.settings.profiles._read_profiles_from", _read_profiles_from
+    )
+    monkeypatch.setattr(
+        "prefect.settings.profiles._write_profiles_to", _write_profiles_to
+    )
+    yield stored
+
+
+def test_set_using_default_profile(stored_profiles):
     with use_profile("ephemeral"):
         invoke_and_assert(
             ["config", "set", "PREFECT_TEST_SETTING=DEBUG"],
-            expected_output="""
-                Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
-                Updated profile 'ephemeral'.
-                """,
+            expected_output=SET_DEFAULT_PROFILE_OUTPUT,
         )
 
-    profiles = load_profiles()
-    assert "ephemeral" in profiles
-    assert profiles["ephemeral"].settings == {
-        PREFECT_TEST_SETTING: "DEBUG",
-        PREFECT_SERVER_ALLOW_EPHEMERAL_MODE: "true",
-    }
+    saved_settings = stored_profiles["profiles"]["ephemeral"]
+    assert saved_settings == {
+        "PREFECT_TEST_SETTING": "DEBUG",
+        "PREFECT_SERVER_ALLOW_EPHEMERAL_MODE": "true",
+    }, f"Unexpected settings saved: {saved_settings}"
 
 
-def test_set_using_profile_flag():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+def test_set_using_profile_flag(stored_profiles):
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "set", "PREFECT_TEST_SETTING=DEBUG"],
-        expected_output="""
-            Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
-            Updated profile 'foo'.
-            """,
+        expected_output=SET_FOO_PROFILE_OUTPUT,
     )
 
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {PREFECT_TEST_SETTING: "DEBUG"}
+    saved_settings = stored_profiles["profiles"]["foo"]
+    assert saved_settings == {
+        "PREFECT_TEST_SETTING": "DEBUG"
+    }, f"Unexpected settings saved: {saved_settings}"
+
+
+@pytest.mark.parametrize(
+    "settings,expected_output,expected_settings",
+    [
+        (
+            ["PREFECT_API_KEY=foo=bar"],
+            SET_EQUAL_SIGN_IN_VALUE_OUTPUT,
+            {"PREFECT_API_KEY": "foo=bar"},
+        ),
+        (
+            ["PREFECT_API_KEY=FOO", "PREFECT_TEST_SETTING=DEBUG"],
+            SET_MULTIPLE_SETTINGS_OUTPUT,
+            {"PREFECT_TEST_SETTING": "DEBUG", "PREFECT_API_KEY": "FOO"},
+        ),
+    ],
+    ids=["equal-sign-in-value", "multiple-settings"],
+)
+def test_set_updates_profile(
+    capsys, monkeypatch, stored_profiles, settings, expected_output, expected_settings
+):
+    save_profiles(EMPTY_FOO_PROFILES)
+
+    # Call the command directly; argument parsing is covered by the tests that go
+    # through the CLI runner. Install a console configured like the root callback's
+    # so the output does not depend on the console left behind by an earlier test.
+    with (
+        use_profile("foo", override_environment_variables=True),
+        pytest.raises(Exit) as exc_info,
+    ):
+        monkeypatch.setattr(
+            app,
+            "console",
+            Console(
+                highlight=False,
+                soft_wrap=not PREFECT_CLI_WRAP_LINES.value(),
+                force_interactive=PREFECT_CLI_PROMPT.value(),
+            ),
+        )
+        config_set(settings)
+
+    assert (
+        exc_info.value.exit_code == 0
+    ), f"Unexpected exit code: {exc_info.value.exit_code}"
+    output = capsys.readouterr().out.strip()
+    assert output == expected_output, f"Unexpected output:\n{output}"
+    saved_settings = stored_profiles["profiles"]["foo"]
+    assert (
+        saved_settings == expected_settings
+    ), f"Unexpected settings saved: {saved_settings}"
 
 
 def test_set_with_unknown_setting():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "set", "PREFECT_FOO=BAR"],
-        expected_output="""
-            Unknown setting name 'PREFECT_FOO'.
-            """,
+        expected_output=UNKNOWN_SETTING_OUTPUT,
         expected_code=1,
     )
 
 
 @pytest.mark.parametrize("setting", ["PREFECT_HOME", "PREFECT_PROFILES_PATH"])
 def test_set_with_disallowed_setting(setting):
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "set", f"{setting}=BAR"],
-        expected_output=f"""
-            Setting {setting!r} cannot be changed with this command. Use an environment variable instead.
-            """,
+        expected_output=DISALLOWED_SETTING_OUTPUT.format(setting),
         expected_code=1,
     )
 
 
-def test_set_with_invalid_value_type():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+def test_set_with_invalid_value_type(stored_profiles):
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "set", "PREFECT_API_DATABASE_TIMEOUT=HELLO"],
@@ -128,109 +308,67 @@ def test_set_with_invalid_value_type():
         expected_code=1,
     )
 
-    profiles = load_profiles()
     assert (
-        PREFECT_API_DATABASE_TIMEOUT not in profiles["foo"].settings
+        "PREFECT_API_DATABASE_TIMEOUT" not in stored_profiles["profiles"]["foo"]
     ), "The setting should not be saved"
 
 
 def test_set_with_unparsable_setting():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "set", "PREFECT_FOO_BAR"],
-        expected_output="""
-            Failed to parse argument 'PREFECT_FOO_BAR'. Use the format 'VAR=VAL'.
-            """,
+        expected_output=UNPARSABLE_SETTING_OUTPUT,
         expected_code=1,
     )
 
 
-def test_set_setting_with_equal_sign_in_value():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
-
-    invoke_and_assert(
-        ["--profile", "foo", "config", "set", "PREFECT_API_KEY=foo=bar"],
-        expected_output="""
-            Set 'PREFECT_API_KEY' to 'foo=bar'.
-            Updated profile 'foo'.
-            """,
-    )
-
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {PREFECT_API_KEY: "foo=bar"}
-
-
-def test_set_multiple_settings():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
-
-    invoke_and_assert(
-        [
-            "--profile",
-            "foo",
-            "config",
-            "set",
-            "PREFECT_API_KEY=FOO",
-            "PREFECT_TEST_SETTING=DEBUG",
-        ],
-        expected_output="""
-            Set 'PREFECT_API_KEY' to 'FOO'.
-            Set 'PREFECT_TEST_SETTING' to 'DEBUG'.
-            Updated profile 'foo'.
-            """,
-    )
-
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {
-        PREFECT_TEST_SETTING: "DEBUG",
-        PREFECT_API_KEY: "FOO",
-    }
-
-
-def test_unset_retains_other_keys():
+@pytest.mark.parametrize(
+    "initial_settings,command,expected_output,expected_settings",
+    [
+        (
+            {PREFECT_TEST_SETTING: "DEBUG", PREFECT_API_KEY: "FOO"},
+            ["PREFECT_API_KEY"],
+            UNSET_SINGLE_SETTING_OUTPUT,
+            {"PREFECT_TEST_SETTING": "DEBUG"},
+        ),
+        (
+            {PREFECT_TEST_SETTING: "DEBUG", PREFECT_API_KEY: "FOO"},
+            ["PREFECT_API_KEY", "PREFECT_TEST_SETTING"],
+            UNSET_MULTIPLE_SETTINGS_OUTPUT,
+            {},
+        ),
+    ],
+    ids=["retains-other-keys", "multiple-settings"],
+)
+def test_unset_updates_profile(
+    stored_profiles, initial_settings, command, expected_output, expected_settings
+):
     save_profiles(
         ProfilesCollection(
-            [
-                Profile(
-                    name="foo",
-                    settings={
-                        PREFECT_TEST_SETTING: "DEBUG",
-                        PREFECT_API_KEY: "FOO",
-                    },
-                )
-            ],
+            [Profile.model_construct(name="foo", settings=initial_settings)],
             active=None,
         )
     )
 
     invoke_and_assert(
-        [
-            "--profile",
-            "foo",
-            "config",
-            "unset",
-            "PREFECT_API_KEY",
-        ],
+        ["--profile", "foo", "config", "unset", *command],
         user_input="y",
-        expected_output_contains="""
-            Unset 'PREFECT_API_KEY'.
-            Updated profile 'foo'.
-            """,
+        expected_output_contains=expected_output,
     )
 
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {PREFECT_TEST_SETTING: "DEBUG"}
+    saved_settings = stored_profiles["profiles"]["foo"]
+    assert (
+        saved_settings == expected_settings
+    ), f"Unexpected settings saved: {saved_settings}"
 
 
-def test_unset_warns_if_present_in_environment(monkeypatch):
+def test_unset_warns_if_present_in_environment(monkeypatch, stored_profiles):
     monkeypatch.setenv("PREFECT_API_KEY", "TEST")
     save_profiles(
         ProfilesCollection(
             [
-                Profile(
+                Profile.model_construct(
                     name="foo",
                     settings={PREFECT_API_KEY: "FOO"},
                 )
@@ -248,26 +386,19 @@ def test_unset_warns_if_present_in_environment(monkeypatch):
             "PREFECT_API_KEY",
         ],
         user_input="y",
-        expected_output_contains="""
-            Unset 'PREFECT_API_KEY'.
-            'PREFECT_API_KEY' is also set by an environment variable. Use `unset PREFECT_API_KEY` to clear it.
-            Updated profile 'foo'.
-            """,
+        expected_output_contains=UNSET_PRESENT_IN_ENVIRONMENT_OUTPUT,
     )
 
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {}
+    saved_settings = stored_profiles["profiles"]["foo"]
+    assert saved_settings == {}, f"Unexpected settings saved: {saved_settings}"
 
 
 def test_unset_with_unknown_setting():
-    save_profiles(ProfilesCollection([Profile(name="foo", settings={})], active=None))
+    save_profiles(EMPTY_FOO_PROFILES)
 
     invoke_and_assert(
         ["--profile", "foo", "config", "unset", "PREFECT_FOO"],
-        expected_output="""
-            Unknown setting name 'PREFECT_FOO'.
-            """,
+        expected_output=UNKNOWN_SETTING_OUTPUT,
         expected_code=1,
     )
 
@@ -276,7 +407,7 @@ def test_unset_with_setting_not_in_profile():
     save_profiles(
         ProfilesCollection(
             [
-                Profile(
+                Profile.model_construct(
                     name="foo",
                     settings={PREFECT_API_KEY: "FOO"},
                 )
@@ -293,100 +424,54 @@ def test_unset_with_setting_not_in_profile():
             "unset",
             "PREFECT_TEST_SETTING",
         ],
-        expected_output="""
-           'PREFECT_TEST_SETTING' is not set in profile 'foo'.
-            """,
+        expected_output=SETTING_NOT_IN_PROFILE_OUTPUT,
         expected_code=1,
     )
 
 
-def test_unset_multiple_settings():
-    save_profiles(
-        ProfilesCollection(
-            [
-                Profile(
-                    name="foo",
-                    settings={
-                        PREFECT_TEST_SETTING: "DEBUG",
-                        PREFECT_API_KEY: "FOO",
-                    },
-                )
-            ],
-            active=None,
-        )
-    )
-
-    invoke_and_assert(
-        [
-            "--profile",
-            "foo",
-            "config",
-            "unset",
-            "PREFECT_API_KEY",
-            "PREFECT_TEST_SETTING",
-        ],
-        user_input="y",
-        expected_output_contains="""
-            Unset 'PREFECT_API_KEY'.
-            Unset 'PREFECT_TEST_SETTING'.
-            Updated profile 'foo'.
-            """,
-    )
-
-    profiles = load_profiles()
-    assert "foo" in profiles
-    assert profiles["foo"].settings == {}
-
-
 def test_view_excludes_unset_settings_without_show_defaults_flag(monkeypatch):
     # Clear the environment
-    for key in _get_valid_setting_names(prefect.settings.Settings):
+    for key in SETTING_NAMES:
         monkeypatch.delenv(key, raising=False)
 
     monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_TIMEOUT", "2.5")
 
     with prefect.context.use_profile(
-        prefect.settings.Profile(
-            name="foo",
-            settings={
-                PREFECT_API_DATABASE_TIMEOUT: 2.0,
-                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: 1000001,
-            },
-        ),
+        VIEW_PROFILE,
         include_current_context=True,
     ) as ctx:
         res = invoke_and_assert(["config", "view", "--hide-sources"])
 
         # Collect just settings that are set
-        expected = ctx.settings.model_dump(exclude_unset=True)
+        expected = ctx.settings.model_fields_set
 
     lines = res.stdout.splitlines()
     assert "PREFECT_PROFILE='foo'" in lines
 
     assert len(expected) < len(
-        _get_valid_setting_names(prefect.settings.Settings)
+        SETTING_NAMES
     ), "All settings were not expected; we should only have a subset."
 
 
 @pytest.mark.skip("TODO")
 def test_view_includes_unset_settings_with_show_defaults():
-    expected_settings = prefect.settings.get_current_settings().model_dump()
+    current_settings = prefect.settings.get_current_settings()
+    expected_settings = {
+        name: SETTING_FIELDS[name].value_from(current_settings)
+        for name in SETTING_NAMES
+    }
 
     res = invoke_and_assert(["config", "view", "--show-defaults", "--hide-sources"])
 
-    lines = res.stdout.splitlines()
-
     # Parse the output for settings displayed, skip the first PREFECT_PROFILE line
-    printed_settings = {}
-    for line in lines[1:]:
-        setting, value = line.split("=", maxsplit=1)
-        assert (
-            setting not in printed_settings
-        ), f"Setting displayed multiple times: {setting}"
-        printed_settings[setting] = value
+    printed_lines = SETTING_LINE_RE.findall(res.stdout)[1:]
+    printed_settings = dict(printed_lines)
+    assert len(printed_settings) == len(
+        printed_lines
+    ), "Setting displayed multiple times"
 
-    assert printed_settings.keys() == _get_valid_setting_names(
-        prefect.settings.Settings
+    assert (
+        frozenset(printed_settings) == SETTING_NAMES
     ), "All settings should be displayed"
 
     for key, value in printed_settings.items():
@@ -396,99 +481,94 @@ def test_view_includes_unset_settings_with_show_defaults():
         ):  # TODO: clean this up
             continue
         assert (
-            value
-            == (
-                expected_value
-                := f"'{expected_settings[prefect.settings.env_var_to_accessor(key)]}'"
-            )
+            value == (expected_value := f"'{expected_settings[key]}'")
         ), f"Displayed setting does not match set value: {key} = {value} != {expected_value}"
 
 
-@pytest.mark.parametrize(
-    "command",
-    [
+@pytest.fixture(
+    scope="module",
+    params=[
         ["config", "view"],  # --show-sources is default behavior
         ["config", "view", "--show-sources"],
         ["config", "view", "--show-defaults"],
+        ["config", "view", "--hide-sources"],
+        ["config", "view", "--hide-sources", "--show-defaults"],
+    ],
+    ids=[
+        "default",
+        "show-sources",
+        "show-defaults",
+        "hide-sources",
+        "hide-sources-show-defaults",
     ],
-    ids=["default", "show-sources", "show-defaults"],
 )
-def test_view_shows_setting_sources(monkeypatch, command):
-    monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_TIMEOUT", "2.5")
-
-    with prefect.context.use_profile(
-        prefect.settings.Profile(
-            name="foo",
-            settings={
-                PREFECT_API_DATABASE_TIMEOUT: 2.0,
-                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: 1000001,
-            },
-        )
+def view_output(request, tmp_path_factory):
+    """
+    Run `prefect config view` once per command and return the output lines.
+
+    Module-scoped fixtures are set up before the function-scoped autouse fixtures, so
+    the environment and profiles path are isolated here instead. `config view` only
+    reads the settings context and never loads or saves profiles.
+    """
+    profiles_path = tmp_path_factory.mktemp("view") / "profiles.toml"
+
+    with (
+        pytest.MonkeyPatch.context() as monkeypatch,
+        temporary_settings({PREFECT_PROFILES_PATH: profiles_path}),
     ):
-        res = invoke_and_assert(command)
+        monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_TIMEOUT", "2.5")
+
+        with prefect.context.use_profile(VIEW_PROFILE):
+            res = invoke_and_assert(request.param)
+
+    return request.param, res.stdout.splitlines()
 
-    lines = res.stdout.splitlines()
+
+def test_view_shows_setting_sources(view_output):
+    command, lines = view_output
+    show_sources = "--hide-sources" not in command
 
     # Get index of line that has current profile
     i = next(i for i, line in enumerate(lines) if "PREFECT_PROFILE" in line)
-    assert lines[i] == "PREFECT_PROFILE='foo'"
+    assert lines[i] == "PREFECT_PROFILE='foo'", f"Unexpected profile line: {lines[i]}"
+
+    # Every setting line ends with a source when sources are shown, and no line at all
+    # does when they are hidden
+    for line in lines[i + 1 :] if show_sources else lines:
+        assert (
+            line.endswith((FROM_DEFAULT, FROM_PROFILE, FROM_ENV)) == show_sources
+        ), f"Source {'missing from' if show_sources else 'included in'} line: {line}"
 
-    for line in lines[i + 1 :]:
-        # Assert that each line ends with a source
-        assert any(
-            line.endswith(s) for s in [FROM_DEFAULT, FROM_PROFILE, FROM_ENV]
-        ), f"Source missing from line: {line}"
+    def source(blurb: str) -> str:
+        return f" {blurb}" if show_sources else ""
 
-    # Assert that sources are correct
-    assert f"PREFECT_API_DATABASE_TIMEOUT='2.0' {FROM_PROFILE}" in lines
-    assert f"PREFECT_LOGGING_TO_API_MAX_LOG_SIZE='1000001' {FROM_PROFILE}" in lines
-    assert f"PREFECT_API_DATABASE_CONNECTION_TIMEOUT='2.5' {FROM_ENV}" in lines
+    # Assert that the settings that we know are set are included with correct sources
+    assert f"PREFECT_API_DATABASE_TIMEOUT='2.0'{source(FROM_PROFILE)}" in lines
+    assert (
+        f"PREFECT_LOGGING_TO_API_MAX_LOG_SIZE='1000001'{source(FROM_PROFILE)}" in lines
+    )
+    assert f"PREFECT_API_DATABASE_CONNECTION_TIMEOUT='2.5'{source(FROM_ENV)}" in lines
 
     if "--show-defaults" in command:
-        # Check that defaults sources are correct by checking an unset setting
+        # Check that defaults are included correctly by checking an unset setting
         assert (
-            f"PREFECT_API_SERVICES_SCHEDULER_LOOP_SECONDS='60.0' {FROM_DEFAULT}"
+            f"PREFECT_API_SERVICES_SCHEDULER_LOOP_SECONDS='60.0'{source(FROM_DEFAULT)}"
             in lines
         )
 
 
-@pytest.mark.parametrize(
-    "command",
-    [
-        ["config", "view", "--hide-sources"],
-        ["config", "view", "--hide-sources", "--show-defaults"],
-    ],
-)
-def test_view_with_hide_sources_excludes_sources(monkeypatch, command):
-    monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_TIMEOUT", "2.5")
+@pytest.fixture
+def foo_profile_with_secrets(monkeypatch):
+    monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_URL", "secret-connection-url")
 
     with prefect.context.use_profile(
-        prefect.settings.Profile(
+        prefect.settings.Profile.model_construct(
             name="foo",
-            settings={
-                PREFECT_API_DATABASE_TIMEOUT: 2.0,
-                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: 1000001,
-            },
+            settings={PREFECT_API_KEY: "secret-api-key"},
         ),
-    ):
-        res = invoke_and_assert(command)
-
-    lines = res.stdout.splitlines()
-
-    for line in lines:
-        # Assert that each line does not end with a source
-        assert not any(
-            line.endswith(s) for s in [FROM_DEFAULT, FROM_PROFILE, FROM_ENV]
-        ), f"Source included in line: {line}"
-
-    # Ensure that the settings that we know are set are still included
-    assert "PREFECT_API_DATABASE_TIMEOUT='2.0'" in lines
-    assert "PREFECT_LOGGING_TO_API_MAX_LOG_SIZE='1000001'" in lines
-    assert "PREFECT_API_DATABASE_CONNECTION_TIMEOUT='2.5'" in lines
-
-    if "--show-defaults" in command:
-        # Check that defaults are included correctly by checking an unset setting
-        assert "PREFECT_API_SERVICES_SCHEDULER_LOOP_SECONDS='60.0'" in lines
+        include_current_context=False,
+    ) as ctx:
+        yield ctx
 
 
 @pytest.mark.parametrize(
@@ -499,17 +579,9 @@ def test_view_with_hide_sources_excludes_sources(monkeypatch, command):
         ["config", "view", "--show-defaults"],
     ],
 )
-def test_view_obfuscates_secrets(monkeypatch, command):
-    monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_URL", "secret-connection-url")
-
-    with prefect.context.use_profile(
-        prefect.settings.Profile(
-            name="foo",
-            settings={PREFECT_API_KEY: "secret-api-key"},
-        ),
-        include_current_context=False,
-    ):
-        res = invoke_and_assert(command)
+@pytest.mark.usefixtures("foo_profile_with_secrets")
+def test_view_obfuscates_secrets(command):
+    res = invoke_and_assert(command)
 
     lines = res.stdout.splitlines()
     assert f"PREFECT_API_DATABASE_CONNECTION_URL='********' {FROM_ENV}" in lines
@@ -528,17 +600,9 @@ def test_view_obfuscates_secrets(monkeypatch, command):
         ["config", "view", "--show-secrets", "--show-defaults"],
     ],
 )
-def test_view_shows_secrets(monkeypatch, command):
-    monkeypatch.setenv("PREFECT_API_DATABASE_CONNECTION_URL", "secret-connection-url")
-
-    with prefect.context.use_profile(
-        prefect.settings.Profile(
-            name="foo",
-            settings={PREFECT_API_KEY: "secret-api-key"},
-        ),
-        include_current_context=False,
-    ):
-        res = invoke_and_assert(command)
+@pytest.mark.usefixtures("foo_profile_with_secrets")
+def test_view_shows_secrets(command):
+    res = invoke_and_assert(command)
 
     lines = res.stdout.splitlines()
 
@@ -582,7 +646,7 @@ def test_view_with_env_file_and_profile(tmp_path):
             f.write("PREFECT_CLIENT_RETRY_EXTRA_CODES=300\n")
 
         with prefect.context.use_profile(
-            prefect.settings.Profile(
+            prefect.settings.Profile.model_construct(
                 name="foo",
                 settings={PREFECT_CLIENT_RETRY_EXTRA_CODES: [400]},
             ),
@@ -627,7 +691,7 @@ def test_view_with_prefect_toml_file_and_profile(tmp_path):
             toml.dump(toml_data, f)
 
         with prefect.context.use_profile(
-            prefect.settings.Profile(
+            prefect.settings.Profile.model_construct(
                 name="foo",
                 settings={PREFECT_CLIENT_RETRY_EXTRA_CODES: [400]},
             ),
@@ -672,7 +736,7 @@ def test_view_with_pyproject_toml_file_and_profile(tmp_path):
             toml.dump(toml_data, f)
 
         with prefect.context.use_profile(
-            prefect.settings.Profile(
+            prefect.settings.Profile.model_construct(
                 name="foo",
                 settings={PREFECT_CLIENT_RETRY_EXTRA_CODES: [400]},
             ),